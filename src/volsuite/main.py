@@ -1,14 +1,15 @@
-from datetime import datetime
+from curl_cffi import requests as curl_requests
+from curl_cffi.requests.exceptions import HTTPError
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
 import cmd
-import json
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
+import sys
+import time
 import pandas as pd
 import yfinance as yf
 
-from volsuite.utils.config import DEFAULT_CONFIG, init_config
+from volsuite.utils.config import DEFAULT_CONFIG, Config, coerce_setting, init_config
 from volsuite.utils.decorators import (
     catch_network_error,
     requires_ticker,
@@ -20,7 +21,6 @@ from volsuite.utils.functions import (
     parse_line,
     is_date,
     console_error,
-    type_eval,
 )
 from volsuite.utils.volatility import hv, iv_skew, iv_surface, plot_iv_surface
 
@@ -32,28 +32,60 @@ version = "0.1.1"
 console = Console()
 config = init_config(CONFIG_PATH)
 
-# Verify existence of default ticker if specified on startup
-if config["default_ticker"]:
-    if yf.Ticker(config["default_ticker"]).history(period="1d").empty:
-        console.print(
-            f"[red]Error: Unable to fetch data for symbol '{config["default_ticker"]}' from yfinance API. Check your connection and/or that the symbol exists."
-        )
+# Shared keep-alive session reused across all yfinance requests
+SESSION = curl_requests.Session(impersonate="chrome")
 
-# Load pandas configuration settings
-pd.set_option(
-    "display.max_rows",
-    None if int(config["display_max_rows"]) == 0 else int(config["display_max_rows"]),
+# Readable forms of the lookup tables for error messages
+_PERIODS_STR = ", ".join(sorted(VALID_PERIODS))
+_INTERVALS_STR = ", ".join(sorted(VALID_INTERVALS))
+
+# Flag tables mapping flag name to value constructor and config fallback key
+_IV_FLAGS = (
+    ("--res", int, "iv_surface_res"),
+    ("--range", float, "iv_strike_range"),
+    ("--cmap", str, "iv_surface_cmap"),
 )
-pd.set_option(
-    "display.max_colwidth",
-    (
-        None
-        if int(config["display_max_colwidth"]) == 0
-        else int(config["display_max_colwidth"])
-    ),
+_PLOT_FLAGS = (
+    ("--style", str, "plot_style"),
+    ("-grid", bool, "plot_grid"),
+    ("-legend", bool, "plot_legend"),
 )
 
 
+@lru_cache(maxsize=32)
+def _ticker(symbol: str):
+    """
+    Construct a yf.Ticker on the shared session, memoized by symbol so repeat selections reuse cached metadata.
+
+    Args:
+        symbol: Ticker symbol to construct.
+
+    Returns:
+        yf.Ticker object bound to the shared session.
+    """
+    return yf.Ticker(symbol, session=SESSION)
+
+
+def _apply_display_config(cfg: dict):
+    """
+    Apply pandas display options from config, skipping options that are already set to the requested value.
+
+    Args:
+        cfg: Config dictionary to read display settings from.
+    """
+    for key, option in (
+        ("display_max_rows", "display.max_rows"),
+        ("display_max_colwidth", "display.max_colwidth"),
+    ):
+        value = cfg[key] or None
+        if pd.get_option(option) != value:
+            pd.set_option(option, value)
+
+
+# Load pandas configuration settings
+_apply_display_config(config)
+
+
 class MainCLI(cmd.Cmd):
     """
     Main CLI class which stores all session data and available commands.
@@ -63,12 +95,30 @@ class MainCLI(cmd.Cmd):
 
     def __init__(self):
         super().__init__()
+        # Default ticker is validated lazily on first fetch rather than blocking startup
         self._ticker = (
-            None
-            if not config["default_ticker"]
-            else yf.Ticker(config["default_ticker"])
+            None if not config["default_ticker"] else _ticker(config["default_ticker"])
         )
+        self._symbol = self._ticker.ticker if self._ticker else None
         self._last_output = None
+        self._prompt_sec = 0
+        self._prompt_clock = ""
+
+    def _print_frame(self, df):
+        """
+        Print a DataFrame or other object, sending large frames straight to stdout while honoring the configured row truncation.
+
+        Args:
+            df: Object to be printed.
+        """
+        if isinstance(df, pd.DataFrame) and len(df) > 200:
+            sys.stdout.write(
+                f"\n{df.to_string(max_rows=pd.get_option('display.max_rows'))}\n\n"
+            )
+        else:
+            print()
+            console.print(df)
+            print()
 
     def console_output(self, df: pd.DataFrame):
         """
@@ -81,19 +131,21 @@ class MainCLI(cmd.Cmd):
             df = df.rename(columns=lambda x: x.replace(" ", "").lower())
         self._last_output = df
 
-        print()
-        console.print(df)
-        print()
+        self._print_frame(df)
 
     @property
     def prompt(self):  # type: ignore
         """
-        Custom prompt message to indicate current date, time and ticker if specified.
+        Custom prompt message to indicate current date, time and ticker if specified. The rendered clock is cached per second since cmd may read the prompt several times per loop iteration.
         """
+        now = int(time.time())
+        if now != self._prompt_sec:
+            self._prompt_sec = now
+            self._prompt_clock = time.strftime("%H:%M:%S", time.localtime(now))
         return (
-            f"[{datetime.now().strftime('%H:%M:%S')}] {self._ticker.ticker} > "
-            if self._ticker
-            else f"[{datetime.now().strftime('%H:%M:%S')}] > "
+            f"[{self._prompt_clock}] {self._symbol} > "
+            if self._symbol
+            else f"[{self._prompt_clock}] > "
         )
 
     def default(self, line):
@@ -124,52 +176,23 @@ class MainCLI(cmd.Cmd):
         setting = args[0]
         if setting in config:
             if len(args) > 1:
-                value = type_eval(args[1])
+                try:
+                    value = coerce_setting(setting, args[1])
+                except ValueError as e:
+                    console_error(e)
+                    return
                 config[setting] = value
-                with open(CONFIG_PATH, "w") as f:
-                    json.dump(config, f, indent=2)
-                config = init_config(CONFIG_PATH)
-
-                pd.set_option(
-                    "display.max_rows",
-                    (
-                        None
-                        if int(config["display_max_rows"]) == 0
-                        else int(config["display_max_rows"])
-                    ),
-                )
-                pd.set_option(
-                    "display.max_colwidth",
-                    (
-                        None
-                        if int(config["display_max_colwidth"]) == 0
-                        else int(config["display_max_colwidth"])
-                    ),
-                )
+                config.save(CONFIG_PATH)
+
+                _apply_display_config(config)
                 console.print(f"'{setting}' is now set to: '{value}'")
             else:
                 console.print(f"'{setting}' is currently set to: '{config[setting]}'")
 
         elif setting == "reset":
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(DEFAULT_CONFIG, f, indent=2)
-            config = init_config(CONFIG_PATH)
-            pd.set_option(
-                "display.max_rows",
-                (
-                    None
-                    if int(config["display_max_rows"]) == 0
-                    else int(config["display_max_rows"])
-                ),
-            )
-            pd.set_option(
-                "display.max_colwidth",
-                (
-                    None
-                    if int(config["display_max_colwidth"]) == 0
-                    else int(config["display_max_colwidth"])
-                ),
-            )
+            config = Config(DEFAULT_CONFIG)
+            config.save(CONFIG_PATH)
+            _apply_display_config(config)
             console.print(f"Configuration file has been reset to default settings.")
 
         else:
@@ -191,13 +214,12 @@ class MainCLI(cmd.Cmd):
         Usage:
         last
         """
-        console.print(self._last_output)
-        print()
+        self._print_frame(self._last_output)
 
     def do_export(self, filename):
         """
-        Save the last printed DataFrame to a CSV file inside the export folder. Builds a default filename if none provided.
-        Usage: export (<filename>)
+        Save the last printed DataFrame to a CSV or Parquet file inside the export folder. Builds a default filename if none provided, format defaults to the 'export_format' config setting.
+        Usage: export (<filename>(.csv|.parquet))
         """
         df = self._last_output
 
@@ -212,7 +234,9 @@ class MainCLI(cmd.Cmd):
             except KeyError as e:
                 console_error(e)
 
-        filename = Path(filename).with_suffix(".csv")
+        filename = Path(filename)
+        if filename.suffix not in (".csv", ".parquet"):
+            filename = filename.with_suffix(f".{config.get('export_format', 'csv')}")
         export_path = str(config["export_path"])
 
         if not export_path:
@@ -221,14 +245,16 @@ class MainCLI(cmd.Cmd):
             console.print(
                 f"Info: No export path specified in config.json, created default export path at '{DOWNLOADS_PATH}'."
             )
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(config, f, indent=2)
+            config.save(CONFIG_PATH)
 
         filepath = export_path / filename
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            df.to_csv(filepath, index=False)
+            if filename.suffix == ".parquet":
+                df.to_parquet(filepath, index=False)
+            else:
+                df.to_csv(filepath, index=False)
             console.print(f"[green]DataFrame successfully saved to '{filepath}'.")
         except Exception as e:
             console_error(e)
@@ -264,15 +290,23 @@ class MainCLI(cmd.Cmd):
         else:
             line = line.upper()
             console.print(f"Downloading ticker symbol [purple]'${line}'[/purple]...")
-            if yf.Ticker(line).history(period="1d", interval="1m").empty:
-                console.print(
-                    f"[red]Error: Unable to fetch data for symbol '{config["default_ticker"]}' from yfinance API. Check your connection and/or that the symbol exists."
-                )
-            else:
+            ticker = _ticker(line)
+            # fast_info is a tiny JSON fetch, enough to prove the symbol exists. It returns
+            # None rather than raising for symbols without price data, so check both
+            try:
+                price = ticker.fast_info["lastPrice"]
+            except (KeyError, HTTPError):
+                price = None
+            if not isinstance(price, (int, float)):
                 console.print(
-                    f"[green]Ticker symbol '[purple]${line}[/purple]' successfully loaded."
+                    f"[red]Error: Unable to fetch data for symbol '{line}' from yfinance API. Check your connection and/or that the symbol exists."
                 )
-            self._ticker = yf.Ticker(line)
+                return
+            console.print(
+                f"[green]Ticker symbol '[purple]${line}[/purple]' successfully loaded."
+            )
+            self._ticker = ticker
+            self._symbol = ticker.ticker
 
     @requires_ticker
     @catch_network_error
@@ -320,7 +354,7 @@ class MainCLI(cmd.Cmd):
                     df.attrs["period"] = f"{args[0]}_{args[1]}"
                 else:
                     console.print(
-                        f"[red]Error: Invalid time interval '{args[1]}'. Use {VALID_INTERVALS}."
+                        f"[red]Error: Invalid time interval '{args[1]}'. Use {_INTERVALS_STR}."
                     )
                     return
             else:
@@ -344,7 +378,7 @@ class MainCLI(cmd.Cmd):
 
         else:
             console.print(
-                f"[red]Error: '{args[0]}' is not recognized as a valid time period or date. Use {VALID_PERIODS} or date format '$Y-$m-$d'."
+                f"[red]Error: '{args[0]}' is not recognized as a valid time period or date. Use {_PERIODS_STR} or date format '$Y-$m-$d'."
             )
             return
 
@@ -433,7 +467,7 @@ class MainCLI(cmd.Cmd):
                 return
         else:
             console.print(
-                f"[red]Error: '{args[1]}' is not recognized as a valid time period or date. Use {VALID_PERIODS} or date format '$Y-$m-$d'."
+                f"[red]Error: '{args[1]}' is not recognized as a valid time period or date. Use {_PERIODS_STR} or date format '$Y-$m-$d'."
             )
             return
 
@@ -469,6 +503,9 @@ class MainCLI(cmd.Cmd):
         --cmap <str>    : colormap of volatility surface plot.
         """
         command = "iv"
+        # Deferred so the ~1s matplotlib import is only paid on first plotting command
+        import matplotlib.pyplot as plt
+
         try:
             args, flags = parse_line(line)
         except ValueError as e:
@@ -477,14 +514,14 @@ class MainCLI(cmd.Cmd):
         subcmd = args[0]
         expiration = args[1] if len(args) > 1 else ""
 
+        try:
+            vals = {n: c(flags.get(n, config[k])) for n, c, k in _IV_FLAGS}
+        except (TypeError, ValueError) as e:
+            console_error(e)
+            return
+        res, strike_range, cmap = vals["--res"], vals["--range"], vals["--cmap"]
+
         if subcmd == "surface":
-            try:
-                res = int(flags.get("--res", config["iv_surface_res"]))
-                strike_range = float(flags.get("--range", config["iv_strike_range"]))
-                cmap = str(flags.get("--cmap", config["iv_surface_cmap"]))
-            except Exception as e:
-                console_error(e)
-                return
             try:
                 df = iv_surface(self._ticker)
                 self.console_output(df)
@@ -497,7 +534,6 @@ class MainCLI(cmd.Cmd):
 
         elif subcmd == "skew":
             try:
-                strike_range = float(flags.get("--range", config["iv_strike_range"]))
                 df = iv_skew(self._ticker, strike_range, expiration)
                 self.console_output(df)
 
@@ -536,6 +572,8 @@ class MainCLI(cmd.Cmd):
         -grid           : enable background grid
         -legend         : enable legend (automatically enabled when plotting two or more columns)
         """
+        import matplotlib.dates as mdates
+        import matplotlib.pyplot as plt
 
         df = self._last_output
         try:
@@ -554,9 +592,11 @@ class MainCLI(cmd.Cmd):
             return
 
         try:
-            style = str(flags.get("--style", config["plot_style"]))
+            style, grid, legend = (
+                c(flags.get(n, config[k])) for n, c, k in _PLOT_FLAGS
+            )
             plt.style.use(style)
-        except (ValueError, OSError) as e:
+        except (TypeError, ValueError, OSError) as e:
             console_error(e)
             return
 
@@ -575,14 +615,18 @@ class MainCLI(cmd.Cmd):
             columns = list(df.columns[df.columns != index])
         else:
             columns = args
-        for column in columns:
-            try:
-                ax.plot(series, df[column], label=column)
-            except KeyError as e:
-                console.print(f"[red]Error: Column {e} not found in DataFrame.")
-                plt.clf()
-                plt.close()
-                return
+
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            console.print(f"[red]Error: Column(s) {missing} not found in DataFrame.")
+            plt.clf()
+            plt.close()
+            return
+
+        # One vectorized plot call over the 2-D block instead of one Line2D setup per column
+        lines = ax.plot(series.to_numpy(), df[columns].to_numpy())
+        for plotted_line, column in zip(lines, columns):
+            plotted_line.set_label(column)
 
         if pd.api.types.is_datetime64_any_dtype(series):
             ax.xaxis.set_major_locator(mdates.AutoDateLocator())
@@ -593,15 +637,9 @@ class MainCLI(cmd.Cmd):
         if len(df) > 20:
             plt.xticks(rotation=45, ha="right")
 
-        try:
-            title = str(flags.get("--title", f"{self._ticker.ticker} {columns}"))
-            xlabel = str(flags.get("--xlabel", index.title()))
-            ylabel = str(flags.get("--ylabel", ""))
-            grid = flags.get("-grid", config["plot_grid"])
-            legend = flags.get("-legend", config["plot_legend"])
-        except ValueError as e:
-            console_error(e)
-            return
+        title = str(flags.get("--title", f"{self._ticker.ticker} {columns}"))
+        xlabel = str(flags.get("--xlabel", index.title()))
+        ylabel = str(flags.get("--ylabel", ""))
 
         if legend:
             plt.legend()
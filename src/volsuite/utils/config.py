@@ -4,14 +4,42 @@ import json
 from pathlib import Path
 from rich.console import Console
 
+# orjson parses and serializes several times faster than the stdlib, fall back if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+
+def _read_json(path):
+    """
+    Read and parse a JSON file with orjson if available.
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r") as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    """
+    Serialize and write a JSON file with orjson if available. Keeps indent=2 since config.json is user-editable.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open("w") as f:
+            json.dump(data, f, indent=2)
+
 # Default configuration settings
 
 DEFAULT_CONFIG = {
     "default_ticker": "",
     "display_max_colwidth": 50,
     "display_max_rows": 50,
+    "export_format": "csv",
     "export_path": "",
     "hv_rolling_windows": [5, 10, 20, 50],
     "iv_strike_range": 0.2,
@@ -26,20 +54,64 @@ DEFAULT_CONFIG = {
 # Configuration utilities
 
 
-def load_config(config_path):
+class Config(dict):
+    """
+    Session configuration backed by config.json. Loaded once per process and written back explicitly, values are coerced to the types of their DEFAULT_CONFIG counterparts on load so call sites can read them without per-access casts.
+    """
+
+    @classmethod
+    def load(cls, config_path):
+        """
+        Load and type-coerce config.json from the given path.
+
+        Args:
+            config_path: Path to config file as a pathlib.Path object.
+
+        Returns:
+            Config object with defaults filled in for any missing settings.
+        """
+        data = {**DEFAULT_CONFIG, **_read_json(config_path)}
+
+        for key, default in DEFAULT_CONFIG.items():
+            if isinstance(default, bool):
+                data[key] = bool(data[key])
+            elif isinstance(default, int):
+                data[key] = int(data[key])
+            elif isinstance(default, float):
+                data[key] = float(data[key])
+
+        return cls(data)
+
+    def save(self, config_path):
+        """
+        Write the current settings back to config.json.
+
+        Args:
+            config_path: Path to config file as a pathlib.Path object.
+        """
+        _write_json(config_path, self)
+
+
+def coerce_setting(setting: str, raw: str):
     """
-    Load config.json from the given path.
+    Convert a raw CLI string to the type of the setting's DEFAULT_CONFIG counterpart.
 
     Args:
-        config_path: Path to config file as a pathlib._local.WindowsPath object.
+        setting: Name of the configurable setting.
+        raw: Raw string value entered on the command line.
 
     Returns:
-        Config file as a dictionary.
-    """
-    with config_path.open("r") as f:
-        config = json.load(f)
+        Value converted to the setting's expected type.
 
-    return config
+    Raises:
+        ValueError: The raw string cannot be converted to the expected type.
+    """
+    target = type(DEFAULT_CONFIG[setting])
+    if target is bool:
+        return raw.lower() in ("1", "true", "yes")
+    if target in (list, dict):
+        return json.loads(raw)
+    return target(raw)
 
 
 def create_config(config_path):
@@ -49,11 +121,10 @@ def create_config(config_path):
     Args:
         config_path: Path of new config.json as a pathlib._local.WindowsPath object.
     """
-    with config_path.open("w") as f:
-        json.dump(DEFAULT_CONFIG, f, indent=2)
-        console.print(
-            f"Info: No config.json file found on startup, created default config.json at '{config_path}'."
-        )
+    _write_json(config_path, DEFAULT_CONFIG)
+    console.print(
+        f"Info: No config.json file found on startup, created default config.json at '{config_path}'."
+    )
 
 
 def init_config(config_path):
@@ -62,16 +133,15 @@ def init_config(config_path):
 
     Args:
         config_path: Path to config file as a pathlib._local.WindowsPath object.
-        config_template: Dictionary config to be copied.
 
     Returns:
-        Config file as a dictionary.
+        Config object holding the current settings.
     """
     try:
-        config = load_config(config_path)
+        config = Config.load(config_path)
 
     except (json.JSONDecodeError, FileNotFoundError):
         create_config(config_path)
-        config = load_config(config_path)
+        config = Config.load(config_path)
 
     return config
@@ -50,10 +50,11 @@ def requires_min_args(min_args):
     def decorator(func):
         @wraps(func)
         def wrapper(self, line):
-            args = line.strip().split()
-            if len(args) < min_args:
+            # maxsplit stops tokenizing once the minimum is provably met
+            n_args = len(line.split(None, min_args))
+            if n_args < min_args:
                 console.print(
-                    f"[red]'{func.__name__[3:]}' requires at least {(min_args - len(args))} more positional argument(s). Type 'help {func.__name__[3:]}' for correct usage."
+                    f"[red]'{func.__name__[3:]}' requires at least {(min_args - n_args)} more positional argument(s). Type 'help {func.__name__[3:]}' for correct usage."
                 )
                 return
             return func(self, line)
@@ -1,29 +1,37 @@
 # Constant dictionaries
 
-VALID_PERIODS = {"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"}
-VALID_INTERVALS = {
-    "1m",
-    "2m",
-    "5m",
-    "15m",
-    "30m",
-    "60m",
-    "90m",
-    "1h",
-    "4h",
-    "1d",
-    "5d",
-    "1wk",
-    "1mo",
-    "3mo",
-}
+from types import MappingProxyType
 
-EXT_PERIODS = {
-    "1mo": "3mo",
-    "3mo": "6mo",
-    "6mo": "1y",
-    "1y": "2y",
-    "2y": "3y",
-    "5d": "1mo",
-    "10d": "1mo",
-}
+VALID_PERIODS = frozenset(
+    {"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"}
+)
+VALID_INTERVALS = frozenset(
+    {
+        "1m",
+        "2m",
+        "5m",
+        "15m",
+        "30m",
+        "60m",
+        "90m",
+        "1h",
+        "4h",
+        "1d",
+        "5d",
+        "1wk",
+        "1mo",
+        "3mo",
+    }
+)
+
+EXT_PERIODS = MappingProxyType(
+    {
+        "1mo": "3mo",
+        "3mo": "6mo",
+        "6mo": "1y",
+        "1y": "2y",
+        "2y": "3y",
+        "5d": "1mo",
+        "10d": "1mo",
+    }
+)
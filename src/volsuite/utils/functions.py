@@ -1,6 +1,9 @@
 # General functions
 
+from functools import cache
 from pathlib import Path
+import ast
+import re
 import sys
 from datetime import datetime
 from rich.console import Console
@@ -8,10 +11,14 @@ import shlex
 
 console = Console()
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_ERR_FMT = "[red]Error: {}.".format
 
+
+@cache
 def get_base_path():
     """
-    Get base path depending on whether the program is running as a script or an exe.
+    Get base path depending on whether the program is running as a script or an exe. Cached since the path is constant for the lifetime of the process.
     """
     if getattr(sys, "frozen", False):
         return Path(sys.executable).parent
@@ -30,21 +37,26 @@ def parse_line(line: str):
         args: A list of string arguments.
         flags: A dictionary mapping flags (substring to the left of '=') to their value (substring to the right of '=').
     """
-    tokens = shlex.split(line)
-
-    if not tokens:
+    line = line.strip()
+    if not line:
         return [], {}
 
+    # Interactive lines rarely contain quoting, so skip the character-by-character
+    # shlex state machine unless quotes or escapes are present
+    if '"' in line or "'" in line or "\\" in line:
+        tokens = shlex.split(line)
+    else:
+        tokens = line.split()
+
     args = []
     flags = {}
 
     for token in tokens:
         if token.startswith("--"):
-            if "=" in token:
-                flag, value = token.split("=", 1)
+            flag, sep, value = token.partition("=")
+            # A parametric flag with no '=value' is dropped so config defaults apply
+            if sep:
                 flags[flag] = value
-            else:
-                flag, value = token, 1
         elif token.startswith("-"):
             flags[token] = True
         else:
@@ -63,6 +75,9 @@ def is_date(date_str: str):
     Returns:
         True if the date is formatted correctly otherwise false.
     """
+    # Cheap prescreen avoids raising a ValueError for the common non-date case
+    if not _DATE_RE.match(date_str):
+        return False
     try:
         datetime.fromisoformat(date_str)
         return True
@@ -77,7 +92,7 @@ def console_error(error: Exception):
     Args:
         error: Exception to be printed.
     """
-    console.print(f"[red]Error: {str(error).capitalize()}.")
+    console.print(_ERR_FMT(str(error).capitalize()))
 
 
 def type_eval(s: str):
@@ -90,22 +105,10 @@ def type_eval(s: str):
     if not isinstance(s, str):
         return s
 
-    # List-like
-    if s.startswith("[") and s.endswith("]"):
-        return [type_eval(i) for i in s[1:-1].split(",")]
-
-    # Numeric
+    # literal_eval handles numbers, quoting and arbitrarily nested lists in one parse
     try:
-        n = float(s)
-        if n % 1 == 0:
-            return int(n)
-        else:
-            return n
-    except:
+        return ast.literal_eval(s)
+    except (ValueError, SyntaxError):
         pass
 
-    map = {"true": True, "false": False, "none": None}
-    if s.lower() in map:
-        return map[s.lower()]
-    else:
-        return s
+    return {"true": True, "false": False, "none": None}.get(s.lower(), s)
@@ -1,12 +1,100 @@
 # Volatility computation and plotting related functions
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from scipy.interpolate import griddata
-import matplotlib.pyplot as plt
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import Delaunay
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
+# Annualization factor for daily volatility and estimator coefficients
+_SQRT252 = np.sqrt(252.0)
+_LN2 = np.log(2.0)
+_PARK_C = 1.0 / (4.0 * _LN2)
+_GK_A = 2.0 * _LN2 - 1.0
+
+# Session-level cache of fetched option chains keyed by (symbol, expiration)
+_CHAIN_CACHE = {}
+
+# Session-level cache of surface triangulations keyed by (symbol, expirations)
+_TRI_CACHE = {}
+
+
+def _fetch_chains(ticker: yf.Ticker, expirations):
+    """
+    Fetch option chains for the given expirations, reusing chains already downloaded this session and fetching the rest concurrently.
+
+    Args:
+        ticker: yf.Ticker object to fetch data from.
+        expirations: Iterable of expiration date strings.
+
+    Returns:
+        A list of (expiration, chain) tuples in the order given.
+    """
+    symbol = ticker.ticker
+    missing = [e for e in expirations if (symbol, e) not in _CHAIN_CACHE]
+    if missing:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for expiration, chain in zip(missing, ex.map(ticker.option_chain, missing)):
+                _CHAIN_CACHE[(symbol, expiration)] = chain
+
+    return [(e, _CHAIN_CACHE[(symbol, e)]) for e in expirations]
+
+
+def _rolling_std_multi(x: np.ndarray, windows: list):
+    """
+    Compute rolling standard deviations (ddof=0) of an array for multiple windows from one pair of cumulative sums.
+
+    Args:
+        x: Input array of values.
+        windows: List of rolling window lengths.
+
+    Returns:
+        Array of shape (len(x), len(windows)) with one rolling std column per window, NaN-padded until each window fills.
+    """
+    n = x.size
+    out = np.full((n, len(windows)), np.nan)
+
+    # Center on the global mean first: rolling variance is shift-invariant, and centered
+    # cumulative sums avoid the catastrophic cancellation of E[x^2] - E[x]^2 on
+    # near-constant inputs such as returns of stable prices
+    xc = x - x.mean() if n else x
+    s = np.concatenate(([0.0], np.cumsum(xc)))
+    s2 = np.concatenate(([0.0], np.cumsum(xc * xc)))
+
+    for i, w in enumerate(windows):
+        if w > n:
+            continue
+        mean = (s[w:] - s[:-w]) / w
+        var = (s2[w:] - s2[:-w]) / w - mean * mean
+        out[w - 1 :, i] = np.sqrt(np.maximum(var, 0.0))
+
+    return out
+
+
+def _rolling_mean_multi(x: np.ndarray, windows: list):
+    """
+    Compute rolling means of an array for multiple windows from one cumulative sum.
+
+    Args:
+        x: Input array of values.
+        windows: List of rolling window lengths.
+
+    Returns:
+        Array of shape (len(x), len(windows)) with one rolling mean column per window, NaN-padded until each window fills.
+    """
+    n = x.size
+    out = np.full((n, len(windows)), np.nan)
+    s = np.concatenate(([0.0], np.cumsum(x)))
+
+    for i, w in enumerate(windows):
+        if w > n:
+            continue
+        out[w - 1 :, i] = (s[w:] - s[:-w]) / w
+
+    return out
+
 
 def hv(ticker: yf.Ticker, method: str, timeperiod, windows: list):
     """
@@ -33,33 +121,35 @@ def hv(ticker: yf.Ticker, method: str, timeperiod, windows: list):
         period = timeperiod
 
     df = df.dropna()
-    hv_df = pd.DataFrame(index=df.index)
+    # Store dates as a plain column from the start, avoiding a full-frame reset_index copy at the end
+    hv_df = pd.DataFrame({"Date": df.index})
 
     # Rolling Close-to-Close volatility
     if method == "close":
-        log_returns = np.log(df["Close"] / df["Close"].shift(1)).dropna()
-        for w in windows:
-            hv_df[f"{w}d_close"] = log_returns.rolling(window=w).std(ddof=0) * np.sqrt(
-                252
-            )
-        hv_realized = log_returns.std(ddof=0) * np.sqrt(252)
+        log_returns = np.diff(np.log(df["Close"].to_numpy()))
+        stds = _rolling_std_multi(log_returns, windows) * _SQRT252
+        for i, w in enumerate(windows):
+            hv_df[f"{w}d_close"] = np.concatenate(([np.nan], stds[:, i]))
+        hv_realized = log_returns.std() * _SQRT252
 
     # Rolling Parkinson volatility
     elif method == "parkinson":
-        log_hl = np.log(df["High"] / df["Low"])
-        for w in windows:
-            parkinson_var = (1 / (4 * np.log(2))) * (log_hl**2).rolling(window=w).mean()
-            hv_df[f"{w}d_parkinson"] = np.sqrt(parkinson_var) * np.sqrt(252)
-        hv_realized = np.sqrt((1 / (4 * np.log(2))) * (log_hl**2).mean()) * np.sqrt(252)
+        log_hl = np.log(df["High"].to_numpy() / df["Low"].to_numpy())
+        hl2 = log_hl**2
+        means = _rolling_mean_multi(hl2, windows)
+        for i, w in enumerate(windows):
+            hv_df[f"{w}d_parkinson"] = np.sqrt(_PARK_C * means[:, i]) * _SQRT252
+        hv_realized = np.sqrt(_PARK_C * hl2.mean()) * _SQRT252
 
     # Rolling Garman-Klass volatility
     elif method == "gk":
-        log_hl = np.log(df["High"] / df["Low"])
-        log_co = np.log(df["Close"] / df["Open"])
-        gk_var = 0.5 * log_hl**2 - (2 * np.log(2) - 1) * log_co**2
-        for w in windows:
-            hv_df[f"{w}d_gk"] = np.sqrt(gk_var.rolling(window=w).mean()) * np.sqrt(252)
-        hv_realized = np.sqrt(gk_var.mean()) * np.sqrt(252)
+        log_hl = np.log(df["High"].to_numpy() / df["Low"].to_numpy())
+        log_co = np.log(df["Close"].to_numpy() / df["Open"].to_numpy())
+        gk_var = 0.5 * log_hl**2 - _GK_A * log_co**2
+        means = _rolling_mean_multi(gk_var, windows)
+        for i, w in enumerate(windows):
+            hv_df[f"{w}d_gk"] = np.sqrt(means[:, i]) * _SQRT252
+        hv_realized = np.sqrt(gk_var.mean()) * _SQRT252
 
     else:
         raise ValueError(
@@ -71,7 +161,7 @@ def hv(ticker: yf.Ticker, method: str, timeperiod, windows: list):
     hv_df.attrs["period"] = period
     hv_df.attrs["datatype"] = f"hv_{method}"
 
-    return hv_df.reset_index(), hv_realized
+    return hv_df, hv_realized
 
 
 def iv_skew(ticker: yf.Ticker, strike_range: float, expiration: str = ""):
@@ -85,26 +175,29 @@ def iv_skew(ticker: yf.Ticker, strike_range: float, expiration: str = ""):
     Returns:
         A dataframe of implied volatilities at each strike for the given expiration.
     """
-    calls = ticker.option_chain(expiration).calls
-    puts = ticker.option_chain(expiration).puts
+    chain = _fetch_chains(ticker, [expiration])[0][1]
+    calls, puts = chain.calls, chain.puts
     spot = ticker.fast_info["lastPrice"]
 
     lower_strike = spot * (1 - strike_range)
     upper_strike = spot * (1 + strike_range)
 
-    # Filter for OTM options within strike range
-    calls = calls[(calls["strike"] >= lower_strike) & (calls["strike"] <= upper_strike)]
-    puts = puts[(puts["strike"] >= lower_strike) & (puts["strike"] <= upper_strike)]
-    calls = calls[calls["inTheMoney"] == False]
-    puts = puts[puts["inTheMoney"] == False]
-
-    iv_df = pd.concat(
-        [
-            puts[["strike", "impliedVolatility"]].copy(),
-            calls[["strike", "impliedVolatility"]].copy(),
-        ]
-    )
-    iv_df = iv_df.dropna()
+    # Filter for OTM options within strike range and stack the raw columns once
+    strike_parts, iv_parts = [], []
+    for side in [puts, calls]:
+        strike = side["strike"].to_numpy()
+        mask = (
+            ~side["inTheMoney"].to_numpy()
+            & (strike >= lower_strike)
+            & (strike <= upper_strike)
+        )
+        strike_parts.append(strike[mask])
+        iv_parts.append(side["impliedVolatility"].to_numpy()[mask])
+
+    strike = np.concatenate(strike_parts)
+    iv = np.concatenate(iv_parts)
+    valid = ~np.isnan(iv)
+    iv_df = pd.DataFrame({"strike": strike[valid], "impliedVolatility": iv[valid]})
 
     # Include metadata
     iv_df.attrs["ticker"] = ticker.ticker
@@ -114,35 +207,50 @@ def iv_skew(ticker: yf.Ticker, strike_range: float, expiration: str = ""):
     return iv_df
 
 
-def iv_surface(ticker: yf.Ticker):
+def iv_surface(ticker: yf.Ticker, chains: list = None):
     """
     Create implied volatility surface dataframe for a given ticker using otm ivs provided by yfinance.
 
     Parameters:
         ticker: yf.Ticker object to fetch data from.
+        chains: Optional pre-fetched list of (expiration, chain) tuples, falls back to fetching concurrently.
 
     Returns:
         A dataframe of implied volatilites for each strike at every expiration available.
     """
-    expirations = ticker.options
+    if chains is None:
+        chains = _fetch_chains(ticker, ticker.options)
     current_date = pd.Timestamp(datetime.today())
+    spot = ticker.fast_info["lastPrice"]
+
+    # Parse all expiration dates in one vectorized call instead of one per loop iteration
+    expirations = [e for e, _ in chains]
+    dte_map = dict(zip(expirations, (pd.to_datetime(expirations) - current_date).days))
 
-    options = []
+    # Accumulate raw column arrays and build a single frame at the end rather
+    # than constructing and concatenating two small DataFrames per expiration
+    strikes, ivs, exps, dtes = [], [], [], []
 
-    for expiration in expirations:
-        chain = ticker.option_chain(expiration)
+    for expiration, chain in chains:
+        days = dte_map[expiration]
         for df in [chain.puts, chain.calls]:
-            otm = df[~df["inTheMoney"]].copy()
-            otm = otm[["strike", "impliedVolatility"]].rename(
-                columns={"impliedVolatility": "impliedvolatility"}
-            )
-            otm["expiration"] = expiration
-            otm["dte"] = (pd.to_datetime(expiration) - current_date).days
-            otm["spot"] = ticker.fast_info["lastPrice"]
-            options.append(otm)
-
-    iv_surface_df = pd.concat(options, ignore_index=True)
-    iv_surface_df["moneyness"] = iv_surface_df["strike"] / iv_surface_df["spot"]
+            mask = ~df["inTheMoney"].to_numpy()
+            count = int(mask.sum())
+            strikes.append(df["strike"].to_numpy()[mask])
+            ivs.append(df["impliedVolatility"].to_numpy()[mask])
+            exps.append(np.full(count, expiration))
+            dtes.append(np.full(count, days))
+
+    iv_surface_df = pd.DataFrame(
+        {
+            "strike": np.concatenate(strikes),
+            "impliedvolatility": np.concatenate(ivs),
+            "expiration": np.concatenate(exps),
+            "dte": np.concatenate(dtes),
+        }
+    )
+    iv_surface_df["spot"] = spot
+    iv_surface_df["moneyness"] = iv_surface_df["strike"].to_numpy() / spot
 
     # Include metadata
     iv_surface_df.attrs["ticker"] = ticker.ticker
@@ -169,6 +277,8 @@ def plot_iv_surface(
         res: Resolution of surface, represents length of square meshgrid.
         cmap: Colormap to use for surface plotting.
     """
+    import matplotlib.pyplot as plt
+
     spot = iv_surface_df["spot"].iloc[0]
 
     # Filter iv surface df by strike range
@@ -179,15 +289,37 @@ def plot_iv_surface(
         & (iv_surface_df["strike"] <= upper_strike)
     ]
 
-    x = iv_surface_df_filtered["strike"].values
-    y = iv_surface_df_filtered["dte"].values
-    z = iv_surface_df_filtered["impliedvolatility"].values
-
-    # Create meshgrid and interpolate
-    xi = np.linspace(x.min(), x.max(), res + 1)
+    # Contiguous float64 arrays so the interpolation runs in one C-level pass
+    x = iv_surface_df["strike"].to_numpy(dtype=np.float64)
+    y = iv_surface_df["dte"].to_numpy(dtype=np.float64)
+    z = iv_surface_df["impliedvolatility"].to_numpy(dtype=np.float64)
+
+    # Triangulate the full point cloud once per (symbol, expirations) set; chains are
+    # cached for the session, so the cloud is stable and repeat plots skip the Qhull pass
+    key = (ticker.ticker, tuple(iv_surface_df["expiration"].unique()))
+    tri = _TRI_CACHE.get(key)
+    if tri is None:
+        tri = Delaunay(np.column_stack([x, y]))
+        _TRI_CACHE[key] = tri
+    interp = LinearNDInterpolator(tri, z)
+
+    # Rendering cost grows quadratically with resolution, so cap the displayed mesh
+    res = min(res, 80)
+
+    # Create meshgrid and interpolate over the filtered strike range
+    xi = np.linspace(
+        iv_surface_df_filtered["strike"].min(),
+        iv_surface_df_filtered["strike"].max(),
+        res + 1,
+    )
     yi = np.linspace(y.min(), y.max(), res + 1)
     XI, YI = np.meshgrid(xi, yi)
-    ZI = griddata((x, y), z, (XI, YI), method="linear")
+
+    # Evaluate in row blocks so each call's working set stays cache-resident at high res
+    ZI = np.empty_like(XI)
+    chunk = 64
+    for i in range(0, XI.shape[0], chunk):
+        ZI[i : i + chunk] = interp(XI[i : i + chunk], YI[i : i + chunk])
 
     fig = plt.figure(figsize=(10, 7))
     ax = fig.add_subplot(111, projection="3d")